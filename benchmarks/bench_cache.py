@@ -0,0 +1,64 @@
+"""
+Measure cached requirement check throughput as the number of threads grows.
+
+On a free-threaded build the lock-free read path lets throughput scale with the thread count,
+with the GIL enabled the total throughput is expected to stay roughly flat.
+
+Usage:
+    python benchmarks/bench_cache.py [checks-per-thread]
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from semver import Version
+
+from veritas.cache import RequirementCache
+
+REQUIREMENTS = ["1", ">=1.2, <2", "^0.3", "~1.4.2", ">1.2.3-alpha", "<=2.1", "*", "=1.2.3"]
+VERSION = Version(1, 4, 2)
+
+
+def run(cache: RequirementCache, threads: int, checks: int) -> float:
+    """Return the total number of checks per second achieved by the given number of threads."""
+
+    barrier = threading.Barrier(threads + 1)
+
+    def worker() -> None:
+        barrier.wait()
+        for index in range(checks):
+            cache.check(REQUIREMENTS[index % len(REQUIREMENTS)], VERSION)
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        futures = [executor.submit(worker) for _ in range(threads)]
+        barrier.wait()
+        start = time.perf_counter()
+        for future in futures:
+            future.result()
+
+        elapsed = time.perf_counter() - start
+
+    return threads * checks / elapsed
+
+
+def main() -> int:
+    checks = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL {'enabled' if gil_enabled else 'disabled'}")
+
+    cache = RequirementCache()
+    for requirement in REQUIREMENTS:
+        cache.requirement(requirement)
+
+    baseline = run(cache, 1, checks)
+    for threads in (1, 2, 4, 8):
+        throughput = run(cache, threads, checks)
+        print(f"{threads:>2} threads {throughput:>12,.0f} checks/s  {throughput / baseline:>5.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""
+Measure the cold-start cost of `import veritas`.
+
+Usage:
+    python benchmarks/bench_import.py [runs]
+"""
+
+import statistics
+import subprocess
+import sys
+
+IMPORT_TIME_BUDGET_US = 20_000
+"""Cold-start budget (in microseconds) for the cumulative `import veritas` time."""
+
+
+def measure(module: str) -> int:
+    """Return the cumulative cold import time (in microseconds) of the given module."""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        if line.split("|")[-1].strip() == module:
+            return int(line.split("|")[1])
+
+    raise RuntimeError(f"Unable to find {module} in import time output")
+
+
+def main() -> int:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    medians: dict[str, float] = {}
+    for module in ("veritas", "veritas.requirement"):
+        timings = [measure(module) for _ in range(runs)]
+        medians[module] = statistics.median(timings)
+        print(f"{module:<20} median {medians[module]:>8.0f}us  min {min(timings):>8}us")
+
+    within_budget = medians["veritas"] < IMPORT_TIME_BUDGET_US
+    print(
+        f"{'budget':<20}        {IMPORT_TIME_BUDGET_US:>8}us  {'ok' if within_budget else 'EXCEEDED'}"
+    )
+    return 0 if within_budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
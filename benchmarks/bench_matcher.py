@@ -0,0 +1,55 @@
+"""
+Compare matching raw version strings with the prefix tree against parsing every version.
+
+Usage:
+    python benchmarks/bench_matcher.py [versions]
+"""
+
+import random
+import sys
+import timeit
+
+from semver import Version
+
+from veritas.matcher import SpecMatcher
+from veritas.spec import VersionSpec
+
+SPECIFICATIONS = ["1.2.*", "1.4", "2.*", "=3.1.4", "4.0.2", "^5.3", ">9"]
+"""Mostly wildcard and exact specifications, with a single operator specification."""
+
+
+def main() -> int:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    rng = random.Random(0)
+    versions = [
+        f"{rng.randint(0, 10)}.{rng.randint(0, 9)}.{rng.randint(0, 20)}" for _ in range(count)
+    ]
+    buffers = [version.encode("ascii") for version in versions]
+
+    specs = [VersionSpec.parse(specification) for specification in SPECIFICATIONS]
+    matcher = SpecMatcher(specs)
+
+    def reference() -> list[bool]:
+        return [any(spec.check(Version.parse(version)) for spec in specs) for version in versions]
+
+    def trie() -> list[bool]:
+        return [matcher.match(version) for version in versions]
+
+    def trie_bytes() -> list[bool]:
+        return [matcher.match(buffer) for buffer in buffers]
+
+    expected = reference()
+    for name, engine in (
+        ("parse and check", reference),
+        ("trie", trie),
+        ("trie (bytes)", trie_bytes),
+    ):
+        assert engine() == expected, name
+        elapsed = min(timeit.repeat(engine, number=1, repeat=5))
+        print(f"{name:<16} {elapsed / count * 1e9:>10.0f}ns/version")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
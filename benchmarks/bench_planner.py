@@ -0,0 +1,66 @@
+"""
+Compare bulk upgrade planning against checking every catalog version for every row.
+
+Usage:
+    python benchmarks/bench_planner.py [rows]
+"""
+
+import random
+import sys
+import time
+
+from semver import Version
+
+from veritas.planner import PlanRow_T, plan_upgrades
+from veritas.requirement import VersionRequirement
+
+REQUIREMENTS = ["^1", "^1.4", ">=1.2, <3", "~2.1", ">=0.9", "<2"]
+"""Requirements shared across the generated rows, as is typical for lockfiles."""
+
+
+def generate(
+    rows: int, packages: int, seed: int = 0
+) -> tuple[list[PlanRow_T], dict[str, list[Version]]]:
+    """Generate pinned dependency rows and a version catalog for the given number of packages."""
+
+    rng = random.Random(seed)
+    catalog = {
+        f"package-{index}": [
+            Version(major, minor, patch)
+            for major in range(3)
+            for minor in range(6)
+            for patch in range(rng.randint(1, 8))
+        ]
+        for index in range(packages)
+    }
+    requirements = [VersionRequirement.parse(requirement) for requirement in REQUIREMENTS]
+    plan_rows: list[PlanRow_T] = [
+        (f"package-{rng.randrange(packages)}", Version(1, 0, 0), rng.choice(requirements))
+        for _ in range(rows)
+    ]
+    return plan_rows, catalog
+
+
+def main() -> int:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    plan_rows, catalog = generate(rows, packages=max(1, rows // 20))
+
+    start = time.perf_counter()
+    naive = [
+        max((version for version in catalog[package] if requirement.check(version)), default=None)
+        for package, _, requirement in plan_rows
+    ]
+    naive_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    candidates = plan_upgrades(plan_rows, catalog)
+    planned_elapsed = time.perf_counter() - start
+
+    assert [candidate.latest_satisfying for candidate in candidates] == naive
+    print(f"{'check per version':<20} {naive_elapsed:>8.3f}s")
+    print(f"{'plan_upgrades':<20} {planned_elapsed:>8.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
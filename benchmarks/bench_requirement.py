@@ -0,0 +1,93 @@
+"""
+Compare requirement check latency on a skewed version distribution.
+
+Most generated versions are rejected by the last specification of the requirement, which is
+the worst case for a fixed evaluation order. Checking the specifications one at a time with an
+early exit still loses to the precomputed interval, which decides every check in at most two
+comparisons. `VersionRequirement.compare` reuses its cached constraints, so it is expected to
+stay close to the bare precomputed interval.
+
+Usage:
+    python benchmarks/bench_requirement.py [checks]
+"""
+
+import random
+import sys
+import timeit
+from collections.abc import Callable
+from functools import partial
+
+from semver import Version
+
+from veritas.requirement import VersionRequirement, compare_constraints
+
+REQUIREMENT = ">=0.5, <10, >=1, <9.5, >=1.2, <9, >=1.3, <7.5"
+"""Requirement with many specifications, where `<7.5` is the one that usually rejects."""
+
+
+def skewed_versions(count: int, seed: int = 0) -> list[Version]:
+    """Generate versions where ~80% are rejected by `<7.5`, ~10% are too low and ~10% pass."""
+
+    rng = random.Random(seed)
+    versions: list[Version] = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.8:
+            versions.append(Version(7, rng.randint(5, 9), rng.randint(0, 20)))
+        elif roll < 0.9:
+            versions.append(Version(0, rng.randint(0, 9), rng.randint(0, 20)))
+        else:
+            versions.append(Version(rng.randint(2, 6), rng.randint(0, 9), rng.randint(0, 20)))
+
+    return versions
+
+
+def precomputed_interval(requirement: VersionRequirement) -> Callable[[Version], int]:
+    """Build a check against the requirement constraints, computed once."""
+
+    return partial(compare_constraints, constraints=requirement.constraints)
+
+
+def fixed_order(requirement: VersionRequirement) -> Callable[[Version], int]:
+    """Build a per-specification early-exit check that keeps the declared order."""
+
+    bounds = [(spec.min, spec.max) for spec in requirement.specs]
+
+    def compare(version: Version) -> int:
+        for constraints in bounds:
+            if result := compare_constraints(version, constraints):
+                return result
+
+        return 0
+
+    return compare
+
+
+def compare_all(compare: Callable[[Version], int], versions: list[Version]) -> list[int]:
+    """Compare every version with the given engine."""
+
+    return [compare(version) for version in versions]
+
+
+def main() -> int:
+    checks = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    versions = skewed_versions(checks)
+    requirement = VersionRequirement.parse(REQUIREMENT)
+
+    engines: dict[str, Callable[[Version], int]] = {
+        "VersionRequirement.compare": requirement.compare,
+        "precomputed interval": precomputed_interval(requirement),
+        "fixed order": fixed_order(requirement),
+    }
+
+    expected = [requirement.compare(version) for version in versions]
+    for name, compare in engines.items():
+        assert compare_all(compare, versions) == expected, name
+        elapsed = min(timeit.repeat(partial(compare_all, compare, versions), number=1, repeat=5))
+        print(f"{name:<28} {elapsed / checks * 1e9:>10.0f}ns/check")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
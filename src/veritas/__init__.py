@@ -1,6 +1,58 @@
 """Semver-based version specifications and requirement parsing."""
 
-from veritas.requirement import VersionRequirement
-from veritas.spec import Version, VersionOperation, VersionSpec
+from importlib import import_module
 
-__all__ = ["VersionRequirement", "VersionOperation", "VersionSpec", "Version"]
+# Public names are resolved lazily so that `import veritas` does not pay for importing `attrs`
+# and `semver` until one of them is actually used.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from veritas.cache import RequirementCache
+    from veritas.matcher import SpecMatcher
+    from veritas.planner import UpgradeCandidate, plan_upgrades
+    from veritas.requirement import BoundSide, RequirementVerdict, VersionRequirement
+    from veritas.spec import Version, VersionOperation, VersionSpec
+
+__all__ = [
+    "VersionRequirement",
+    "VersionOperation",
+    "VersionSpec",
+    "Version",
+    "UpgradeCandidate",
+    "plan_upgrades",
+    "RequirementCache",
+    "SpecMatcher",
+    "RequirementVerdict",
+    "BoundSide",
+]
+
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "VersionRequirement": "veritas.requirement",
+    "VersionOperation": "veritas.spec",
+    "VersionSpec": "veritas.spec",
+    "Version": "veritas.spec",
+    "UpgradeCandidate": "veritas.planner",
+    "plan_upgrades": "veritas.planner",
+    "RequirementCache": "veritas.cache",
+    "SpecMatcher": "veritas.matcher",
+    "RequirementVerdict": "veritas.requirement",
+    "BoundSide": "veritas.requirement",
+}
+"""Mapping of lazily exported attribute names to the module that defines them."""
+
+
+def __getattr__(name: str) -> object:
+    """Import and cache a public attribute on first access."""
+
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including those that have not been imported yet."""
+
+    return sorted({*globals(), *__all__})
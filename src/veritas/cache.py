@@ -0,0 +1,220 @@
+import threading
+from collections.abc import Callable
+from itertools import islice
+from typing import Generic, TypeVar
+
+from attrs import define, field
+from semver.version import Version
+
+from veritas.requirement import VersionRequirement, compare_constraints
+from veritas.spec import VersionSpec
+
+T = TypeVar("T")
+
+SpecEntry_T = tuple[VersionSpec, Version, Version | None]
+"""
+Defines a cached version specification.
+
+A specification entry is a tuple of:
+- The parsed version specification
+- The minimum version (inclusive) that satisfies the specification
+- The maximum version (exclusive) that satisfies the specification, if any
+"""
+
+RequirementEntry_T = tuple[VersionRequirement, Version, Version | None]
+"""
+Defines a cached version requirement.
+
+A requirement entry is a tuple of:
+- The parsed version requirement
+- The minimum version (inclusive) imposed by the requirement
+- The maximum version (exclusive) imposed by the requirement, if any
+"""
+
+
+def _parse_spec(specification: str) -> SpecEntry_T:
+    """Parse a version specification and compute its bounds."""
+
+    spec = VersionSpec.parse(specification)
+    return spec, spec.min, spec.max
+
+
+def _parse_requirement(requirement: str) -> RequirementEntry_T:
+    """Parse a version requirement and compute its constraints."""
+
+    req = VersionRequirement.parse(requirement)
+    return (req, *req.constraints)
+
+
+@define
+class _ReadMostlyDict(Generic[T]):
+    """Mapping of strings to parsed entries with lock-free reads and a single-writer update path."""
+
+    parse: Callable[[str], T]
+    """Parser producing the entry for a missing key."""
+
+    maxsize: int
+    """Maximum number of entries kept before the older half of them is evicted."""
+
+    _entries: dict[str, T] = field(factory=dict, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+
+        return len(self._entries)
+
+    def get(self, key: str) -> T:
+        """
+        Get the entry for the given key, parsing and publishing it on a miss.
+
+        Args:
+            key (str): The string to look up.
+
+        Returns:
+            T: The cached entry, which may have been published by another thread first.
+        """
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+
+        # Parse outside of the lock so that writers only hold it for the publish itself
+        entry = self.parse(key)
+        with self._lock:
+            published = self._entries.get(key)
+            if published is not None:
+                return published
+
+            if len(self._entries) >= self.maxsize:
+                # Swap in a new mapping holding the newest half of the entries, so concurrent
+                # readers never see a partially evicted one and hot keys mostly stay cached
+                newest = islice(self._entries.items(), len(self._entries) - self.maxsize // 2, None)
+                self._entries = {**dict(newest), key: entry}
+            else:
+                self._entries[key] = entry
+
+            return entry
+
+    def clear(self):
+        """Drop every cached entry."""
+
+        with self._lock:
+            self._entries = {}
+
+
+@define
+class RequirementCache:
+    """
+    Thread-safe cache of parsed version specifications and requirements along with their bounds.
+
+    Thread safety guarantees:
+
+    - Lookups of cached entries never take a lock. They are a single read of the current mapping
+      followed by a single `dict.get`, which is atomic with the GIL and internally synchronized
+      on free-threaded builds.
+    - Misses are parsed outside of any lock and then published by a single writer at a time. The
+      first published entry for a key wins, so every thread observes the same objects for a key
+      for as long as it stays cached. Threads missing the same key at the same time may each
+      parse it, and all but the first result are discarded.
+    - Published entries are never modified. When a mapping is full, it is replaced by a new one
+      holding the most recently published half of its entries, instead of being evicted in
+      place, so readers still holding the old mapping are unaffected. Lookups do not track
+      recency, so an evicted hot key is parsed again on its next miss.
+    - Cached specifications and requirements are shared between threads and must not be mutated.
+      Read-only methods such as `VersionRequirement.explain` keep their precomputed bounds outside
+      of the requirement, so they are safe to call on shared requirements.
+    """
+
+    maxsize: int = field(default=4096)
+    """Maximum number of specifications, and separately requirements, kept in the cache."""
+
+    _specs: _ReadMostlyDict[SpecEntry_T] = field(init=False, repr=False)
+    _requirements: _ReadMostlyDict[RequirementEntry_T] = field(init=False, repr=False)
+
+    def __attrs_post_init__(self):
+        """Validate the cache size and create the underlying mappings."""
+
+        if self.maxsize < 1:
+            raise ValueError(f"Cache size must be positive, got {self.maxsize}")
+
+        self._specs = _ReadMostlyDict(_parse_spec, self.maxsize)
+        self._requirements = _ReadMostlyDict(_parse_requirement, self.maxsize)
+
+    def __len__(self) -> int:
+        """Number of cached specifications and requirements."""
+
+        return len(self._specs) + len(self._requirements)
+
+    def spec(self, specification: str) -> SpecEntry_T:
+        """
+        Get the parsed version specification and its bounds.
+
+        Args:
+            specification (str): The version specification string.
+
+        Returns:
+            SpecEntry_T: The version specification and its minimum and maximum versions.
+
+        Raises:
+            ValueError: If the given version specification is invalid.
+        """
+
+        return self._specs.get(specification)
+
+    def requirement(self, requirement: str) -> RequirementEntry_T:
+        """
+        Get the parsed version requirement and its constraints.
+
+        Args:
+            requirement (str): The version requirement string.
+
+        Returns:
+            RequirementEntry_T: The version requirement and its minimum and maximum versions.
+
+        Raises:
+            ValueError: If the given version requirement is invalid.
+        """
+
+        return self._requirements.get(requirement)
+
+    def compare(self, requirement: str, version: Version) -> int:
+        """
+        Compare the given version to a cached version requirement.
+
+        Args:
+            requirement (str): The version requirement string.
+            version (Version): The version to compare.
+
+        Returns:
+            int: -1 if the version is less than the requirement, 0 if equal, 1 if greater.
+
+        Raises:
+            ValueError: If the given version requirement is invalid.
+        """
+
+        _, min_constraint, max_constraint = self.requirement(requirement)
+        return compare_constraints(version, (min_constraint, max_constraint))
+
+    def check(self, requirement: str, version: Version) -> bool:
+        """
+        Check if the given version satisfies a cached version requirement.
+
+        Args:
+            requirement (str): The version requirement string.
+            version (Version): The version to check.
+
+        Returns:
+            bool: `True` if the version satisfies the requirement, `False` otherwise.
+
+        Raises:
+            ValueError: If the given version requirement is invalid.
+        """
+
+        return self.compare(requirement, version) == 0
+
+    def clear(self):
+        """Drop every cached entry."""
+
+        self._specs.clear()
+        self._requirements.clear()
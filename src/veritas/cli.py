@@ -0,0 +1,258 @@
+"""Command-line interface for filtering streams of versions against a version requirement."""
+
+import os
+import sys
+from argparse import ArgumentParser, Namespace
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from enum import Enum
+from functools import cache, partial
+from itertools import islice
+from multiprocessing import Pool
+from multiprocessing.pool import AsyncResult
+from typing import TextIO
+
+from semver.version import Version
+
+from veritas.requirement import VersionRequirement, compare_constraints
+
+CHUNK_SIZE = 1024
+"""Number of lines read and evaluated together."""
+
+CHUNKS_PER_JOB = 4
+"""Number of chunks allowed in flight per parallel job, bounding memory use."""
+
+
+class OutputMode(Enum):
+    """Enumeration of the ways matching versions are reported."""
+
+    FILTER = "filter"
+    """Emit every matching line in input order."""
+
+    MAX = "max"
+    """Emit the greatest matching version."""
+
+    MIN = "min"
+    """Emit the least matching version."""
+
+    COUNT = "count"
+    """Emit the number of matching versions."""
+
+
+ChunkResult_T = tuple[int, list[str], tuple[Version, str] | None]
+"""
+Defines the result of evaluating a chunk of lines.
+
+A chunk result is a tuple of:
+- The number of matching lines in the chunk
+- The matching lines, only kept for `filter`
+- The best matching version and its line, only kept for `max` and `min`
+"""
+
+
+@cache
+def _load_constraints(requirement: str) -> tuple[Version, Version | None]:
+    """Parse the requirement and compute its constraints once per process."""
+
+    return VersionRequirement.parse(requirement).constraints
+
+
+def _evaluate_chunk(
+    requirement: str, mode: OutputMode, strict: bool, lines: list[str]
+) -> ChunkResult_T:
+    """
+    Evaluate a chunk of lines against the version requirement.
+
+    Args:
+        requirement (str): The version requirement string.
+        mode (OutputMode): The output mode, controlling which matches are kept.
+        strict (bool): Whether invalid versions raise instead of being skipped.
+        lines (list[str]): The lines to evaluate.
+
+    Returns:
+        ChunkResult_T: The number of matches and the matches kept for output.
+
+    Raises:
+        ValueError: If `strict` is set and a line is not a valid version.
+    """
+
+    constraints = _load_constraints(requirement)
+    count = 0
+    matches: list[str] = []
+    best: tuple[Version, str] | None = None
+    for line in lines:
+        text = line.strip()
+        if not text:
+            continue
+
+        try:
+            # Tags are commonly prefixed with `v`, which is not part of the version itself
+            version = Version.parse(text[1:] if text.startswith("v") else text)
+        except ValueError:
+            if strict:
+                raise ValueError(f"Invalid version {text!r}") from None
+            continue
+
+        if compare_constraints(version, constraints) != 0:
+            continue
+
+        count += 1
+        if mode == OutputMode.FILTER:
+            matches.append(text)
+        elif mode == OutputMode.MAX and (best is None or version > best[0]):
+            best = (version, text)
+        elif mode == OutputMode.MIN and (best is None or version < best[0]):
+            best = (version, text)
+
+    return count, matches, best
+
+
+def _read_lines(paths: Sequence[str]) -> Iterator[str]:
+    """Lazily yield the lines of the given files, where `-` reads from stdin."""
+
+    for path in paths:
+        if path == "-":
+            yield from sys.stdin
+            continue
+
+        with open(path, encoding="utf-8") as file:
+            yield from file
+
+
+def _chunk(lines: Iterable[str]) -> Iterator[list[str]]:
+    """Group lines into lists of at most `CHUNK_SIZE` lines."""
+
+    iterator = iter(lines)
+    while chunk := list(islice(iterator, CHUNK_SIZE)):
+        yield chunk
+
+
+def _evaluate_parallel(
+    chunks: Iterable[list[str]], evaluate: partial[ChunkResult_T], jobs: int
+) -> Iterator[ChunkResult_T]:
+    """
+    Evaluate chunks in worker processes while preserving input order.
+
+    At most `jobs * CHUNKS_PER_JOB` chunks are submitted at any time, so memory use stays
+    constant regardless of the input size.
+    """
+
+    with Pool(processes=jobs) as pool:
+        pending: deque[AsyncResult[ChunkResult_T]] = deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(evaluate, (chunk,)))
+            if len(pending) >= jobs * CHUNKS_PER_JOB:
+                yield pending.popleft().get()
+
+        while pending:
+            yield pending.popleft().get()
+
+
+def _build_parser() -> ArgumentParser:
+    """Build the argument parser for the command-line interface."""
+
+    parser = ArgumentParser(
+        prog="veritas",
+        description="Filter a stream of versions down to those satisfying a version requirement.",
+    )
+    parser.add_argument("requirement", help='version requirement, e.g. ">=1.2, <2"')
+    parser.add_argument(
+        "files",
+        nargs="*",
+        default=["-"],
+        metavar="FILE",
+        help="files with one version per line, optionally prefixed with `v`, `-` or nothing "
+        "reads from stdin",
+    )
+
+    modes = parser.add_mutually_exclusive_group()
+    for mode, description in (
+        (OutputMode.MAX, "print only the greatest matching version"),
+        (OutputMode.MIN, "print only the least matching version"),
+        (OutputMode.COUNT, "print only the number of matching versions"),
+    ):
+        modes.add_argument(
+            f"--{mode.value}",
+            dest="mode",
+            action="store_const",
+            const=mode,
+            default=OutputMode.FILTER,
+            help=description,
+        )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes used to evaluate versions (default: 1)",
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="fail on lines that are not valid versions instead of skipping them",
+    )
+    return parser
+
+
+def _run(args: Namespace, output: TextIO) -> int:
+    """Evaluate the input and write the results, returning the exit status."""
+
+    evaluate = partial(_evaluate_chunk, args.requirement, args.mode, args.strict)
+    chunks = _chunk(_read_lines(args.files))
+    results = (
+        _evaluate_parallel(chunks, evaluate, args.jobs) if args.jobs > 1 else map(evaluate, chunks)
+    )
+
+    total = 0
+    best: tuple[Version, str] | None = None
+    for count, matches, chunk_best in results:
+        total += count
+        output.writelines(f"{text}\n" for text in matches)
+        if chunk_best is not None and (
+            best is None
+            or (args.mode == OutputMode.MAX and chunk_best[0] > best[0])
+            or (args.mode == OutputMode.MIN and chunk_best[0] < best[0])
+        ):
+            best = chunk_best
+
+    if args.mode == OutputMode.COUNT:
+        output.write(f"{total}\n")
+    elif best is not None:
+        output.write(f"{best[1]}\n")
+
+    # Mirror grep: 0 when something matched, 1 when nothing did
+    return 0 if total > 0 else 1
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run the command-line interface.
+
+    Args:
+        argv (Sequence[str] | None): The arguments to parse, defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The exit status, 0 if any version matched, 1 if none did, 2 on errors.
+    """
+
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error(f"--jobs must be positive, got {args.jobs}")
+
+    try:
+        _load_constraints(args.requirement)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    try:
+        return _run(args, sys.stdout)
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`), which is not an error for a filter. Python flushes
+        # stdout on exit, so it is pointed at devnull to avoid raising a second time.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except (OSError, ValueError) as exc:
+        print(f"veritas: {exc}", file=sys.stderr)
+        return 2
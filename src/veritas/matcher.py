@@ -0,0 +1,212 @@
+from collections.abc import Iterable
+from typing import AnyStr
+
+from attrs import define, field
+from semver.version import Version
+
+from veritas.requirement import compare_constraints
+from veritas.spec import WILD, VersionOperation, VersionSpec
+
+TRIE_OPERATIONS = (None, VersionOperation.CARET, VersionOperation.TILDE, VersionOperation.EQ)
+"""Version operations whose specifications can be compiled into the prefix tree."""
+
+
+@define
+class _TrieNode:
+    """Node of the prefix tree over dot-separated version components."""
+
+    children: dict[str | bytes, "_TrieNode"] = field(factory=dict)
+    """Child nodes keyed by the canonical string and ASCII bytes forms of the version component."""
+
+    terminal: bool = field(default=False)
+    """Whether every version below this node matches."""
+
+    def insert(self, path: tuple[int, ...]):
+        """Insert the path of version components, marking its last node as terminal."""
+
+        node = self
+        for component in path:
+            key = str(component)
+            child = node.children.get(key)
+            if child is None:
+                # Both key forms share the child, so raw strings and buffers walk the same tree
+                child = node.children[key] = node.children[key.encode("ascii")] = _TrieNode()
+
+            node = child
+
+        node.terminal = True
+
+
+def _trie_path(spec: VersionSpec) -> tuple[int, ...] | None:
+    """
+    Get the version components a release version must start with to satisfy the specification.
+
+    Args:
+        spec (VersionSpec): The version specification.
+
+    Returns:
+        tuple[int, ...] | None: The required leading components, or `None` if the specification
+            cannot be decided by its components alone.
+    """
+
+    if (
+        spec.op not in TRIE_OPERATIONS
+        or spec.prerelease not in (None, WILD)
+        or spec.build not in (None, WILD)
+    ):
+        return None
+
+    parts = (spec.major, spec.minor, spec.patch)
+    if spec.op == VersionOperation.EQ:
+        # Exact matches only accept the base version, where missing parts default to 0
+        return tuple(part if isinstance(part, int) else 0 for part in parts)
+
+    path: list[int] = []
+    for part in parts:
+        if not isinstance(part, int):
+            break
+
+        path.append(part)
+
+    return tuple(path)
+
+
+@define
+class SpecMatcher:
+    """
+    Matches raw version strings against any of a set of version specifications.
+
+    Wildcard, partial, and exact specifications (without prerelease or build parts) are compiled
+    into a prefix tree over the `major.minor.patch` components. Release versions are decided by
+    walking the tree with the raw components, without creating a `Version`. Versions with
+    prerelease or build parts, and specifications using other operations, fall back to comparing
+    against the precomputed bounds of each specification.
+    """
+
+    specs: list[VersionSpec]
+    """List of version specifications, any of which must be satisfied."""
+
+    _root: _TrieNode = field(init=False, repr=False)
+    _fallback: list[tuple[Version, Version | None]] = field(init=False, repr=False)
+    _bounds: list[tuple[Version, Version | None]] = field(init=False, repr=False)
+
+    def __attrs_post_init__(self):
+        """Compile the specifications into the prefix tree and precompute their bounds."""
+
+        self._root = _TrieNode()
+        self._fallback = []
+        self._bounds = []
+        for spec in self.specs:
+            bounds = (spec.min, spec.max)
+            self._bounds.append(bounds)
+
+            path = _trie_path(spec)
+            if path is None:
+                self._fallback.append(bounds)
+            else:
+                self._root.insert(path)
+
+    @classmethod
+    def parse(cls, specifications: Iterable[str]) -> "SpecMatcher":
+        """
+        Parse version specification strings into a matcher.
+
+        Args:
+            specifications (Iterable[str]): The version specification strings.
+
+        Returns:
+            SpecMatcher: The compiled matcher.
+
+        Raises:
+            ValueError: If any of the given version specifications is invalid.
+        """
+
+        return cls([VersionSpec.parse(specification) for specification in specifications])
+
+    @staticmethod
+    def _within(version: Version, bounds: list[tuple[Version, Version | None]]) -> bool:
+        """Check if the version is within any of the given bounds."""
+
+        return any(compare_constraints(version, constraints) == 0 for constraints in bounds)
+
+    def _walk(self, version: AnyStr, dot: AnyStr, zero: AnyStr) -> bool | None:
+        """
+        Match a raw release version by walking the prefix tree along its components in place.
+
+        Returns:
+            bool | None: Whether the version matches, or `None` if it is not a canonical release
+                version and must take the full path.
+        """
+
+        node: _TrieNode | None = self._root
+        matched = self._root.terminal
+        parts: list[AnyStr] = []
+        start = 0
+        for index in range(3):
+            end = version.find(dot, start) if index < 2 else len(version)
+            part = version[start:end]
+            # Anything other than a canonical number (prerelease, build, leading zeros, or an
+            # invalid version) takes the full path, which also reports invalid versions
+            if (
+                end < 0
+                or not (part.isdigit() and part.isascii())
+                or (len(part) > 1 and part.startswith(zero))
+            ):
+                return None
+
+            if not matched and node is not None:
+                node = node.children.get(part)
+                matched = node is not None and node.terminal
+
+            parts.append(part)
+            start = end + 1
+
+        if matched:
+            return True
+        if not self._fallback:
+            return False
+
+        return self._within(Version(*map(int, parts)), self._fallback)
+
+    def match(self, version: str | bytes | bytearray | memoryview) -> bool:
+        """
+        Check if the raw version string satisfies any of the version specifications.
+
+        Release versions are decided in a single pass, locating components with `find` and
+        looking them up in the prefix tree by slice. Only `bytes` slices are hashable, so
+        `bytearray` and `memoryview` buffers are copied to `bytes` once up front.
+
+        Args:
+            version (str | bytes | bytearray | memoryview): The raw version string or buffer.
+
+        Returns:
+            bool: `True` if the version satisfies any specification, `False` otherwise.
+
+        Raises:
+            ValueError: If the given version is invalid.
+        """
+
+        if isinstance(version, str):
+            result = self._walk(version, ".", "0")
+        else:
+            if not isinstance(version, bytes):
+                version = bytes(version)
+            result = self._walk(version, b".", b"0")
+
+        if result is None:
+            return self._within(Version.parse(version), self._bounds)
+
+        return result
+
+    def check(self, version: Version) -> bool:
+        """
+        Check if the version satisfies any of the version specifications.
+
+        Args:
+            version (Version): The version to check.
+
+        Returns:
+            bool: `True` if the version satisfies any specification, `False` otherwise.
+        """
+
+        return self._within(version, self._bounds)
@@ -0,0 +1,122 @@
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping
+
+from attrs import define
+from semver.version import Version
+
+from veritas.requirement import VersionRequirement
+
+PlanRow_T = tuple[str, Version, VersionRequirement]
+"""
+Defines a single pinned dependency to plan an upgrade for.
+
+A plan row is a tuple of:
+- The package name
+- The currently pinned version
+- The version requirement declared for the package
+"""
+
+
+@define(frozen=True)
+class UpgradeCandidate:
+    """Defines the upgrade options for a single pinned dependency."""
+
+    package: str
+    """Name of the package."""
+
+    pinned: Version
+    """Currently pinned version."""
+
+    requirement: VersionRequirement
+    """Version requirement declared for the package."""
+
+    latest_satisfying: Version | None
+    """Greatest catalog version satisfying the requirement, if any."""
+
+    latest: Version | None
+    """Greatest catalog version, if the package is in the catalog."""
+
+    @property
+    def upgradable(self) -> bool:
+        """Whether a version newer than the pinned one satisfies the requirement."""
+
+        return self.latest_satisfying is not None and self.latest_satisfying > self.pinned
+
+
+def _latest_within(
+    versions: list[Version], constraints: tuple[Version, Version | None]
+) -> Version | None:
+    """
+    Find the greatest version within the given constraints.
+
+    Args:
+        versions (list[Version]): Versions sorted in ascending order.
+        constraints (tuple[Version, Version | None]): Minimum (inclusive) and maximum (exclusive).
+
+    Returns:
+        Version | None: The greatest version within the constraints, if any.
+    """
+
+    min_constraint, max_constraint = constraints
+    # Everything before the insertion point of the exclusive maximum is below the maximum
+    index = len(versions) if max_constraint is None else bisect_left(versions, max_constraint)
+    if index > 0 and versions[index - 1] >= min_constraint:
+        return versions[index - 1]
+
+    return None
+
+
+def plan_upgrades(
+    rows: Iterable[PlanRow_T], catalog: Mapping[str, Iterable[Version]]
+) -> list[UpgradeCandidate]:
+    """
+    Plan upgrades for many pinned dependencies at once.
+
+    Rows are grouped by package and by the constraints of their requirement, so each distinct
+    combination is answered once with a binary search over the package's sorted catalog. Each
+    requirement string is only resolved to its constraints once, regardless of how many packages
+    declare it.
+
+    Args:
+        rows (Iterable[PlanRow_T]): The pinned dependencies to plan upgrades for.
+        catalog (Mapping[str, Iterable[Version]]): Available versions for each package.
+
+    Returns:
+        list[UpgradeCandidate]: The upgrade candidates, in the same order as the given rows.
+
+    Raises:
+        ValueError: If a version requirement includes conflicting specifications.
+    """
+
+    constraints_by_requirement: dict[str, tuple[Version, Version | None]] = {}
+    sorted_catalog: dict[str, list[Version]] = {}
+    answers: dict[tuple[str, tuple[Version, Version | None]], Version | None] = {}
+
+    candidates: list[UpgradeCandidate] = []
+    for package, pinned, requirement in rows:
+        requirement_key = str(requirement)
+        constraints = constraints_by_requirement.get(requirement_key)
+        if constraints is None:
+            constraints = constraints_by_requirement[requirement_key] = requirement.constraints
+
+        versions = sorted_catalog.get(package)
+        if versions is None:
+            versions = sorted_catalog[package] = sorted(catalog.get(package, ()))
+
+        answer_key = (package, constraints)
+        if answer_key in answers:
+            latest_satisfying = answers[answer_key]
+        else:
+            latest_satisfying = answers[answer_key] = _latest_within(versions, constraints)
+
+        candidates.append(
+            UpgradeCandidate(
+                package=package,
+                pinned=pinned,
+                requirement=requirement,
+                latest_satisfying=latest_satisfying,
+                latest=versions[-1] if versions else None,
+            )
+        )
+
+    return candidates
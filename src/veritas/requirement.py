@@ -1,8 +1,90 @@
-from attrs import define
+from collections.abc import Iterable
+from enum import Enum
+from functools import lru_cache
+
+from attrs import define, field
 from semver.version import Version
 
 from veritas.spec import VersionSpec
 
+SpecBounds_T = tuple[VersionSpec, Version, Version | None]
+"""
+Defines the bounds of a single version specification.
+
+A specification bounds entry is a tuple of:
+- The version specification
+- The minimum version (inclusive) that satisfies the specification
+- The maximum version (exclusive) that satisfies the specification, if any
+"""
+
+
+class BoundSide(Enum):
+    """Enumeration of the sides of a version specification that can reject a version."""
+
+    MIN = "min"
+    """The version is less than the minimum version (inclusive)."""
+
+    MAX = "max"
+    """The version is greater than or equal to the maximum version (exclusive)."""
+
+
+def compare_constraints(version: Version, constraints: tuple[Version, Version | None]) -> int:
+    """
+    Compare the given version to precomputed constraints in at most two comparisons.
+
+    Args:
+        version (Version): The version to compare.
+        constraints (tuple[Version, Version | None]): The minimum (inclusive) and maximum
+            (exclusive) versions, as returned by `VersionRequirement.constraints`.
+
+    Returns:
+        int: -1 if the version is less than the constraints, 0 if within, 1 if greater.
+    """
+
+    min_constraint, max_constraint = constraints
+    if version < min_constraint:
+        return -1
+
+    # The max constraint is exclusive, so we also need to check if the version is equal to it
+    if max_constraint is not None and version >= max_constraint:
+        return 1
+
+    return 0
+
+
+@define(frozen=True)
+class RequirementVerdict:
+    """Defines why a version does or does not satisfy a version requirement."""
+
+    version: Version
+    """Version that was checked."""
+
+    spec: VersionSpec | None = field(default=None)
+    """Version specification that rejected the version, `None` if the version is satisfied."""
+
+    side: BoundSide | None = field(default=None)
+    """Side of the rejecting specification the version fell outside of."""
+
+    bound: Version | None = field(default=None)
+    """Bound of the rejecting specification the version fell outside of."""
+
+    @property
+    def satisfied(self) -> bool:
+        """Whether the version satisfies the version requirement."""
+
+        return self.spec is None
+
+    @property
+    def comparison(self) -> int:
+        """-1 if the version is less than the requirement, 0 if equal, 1 if greater."""
+
+        if self.side == BoundSide.MIN:
+            return -1
+        elif self.side == BoundSide.MAX:
+            return 1
+
+        return 0
+
 
 @define
 class VersionRequirement:
@@ -44,13 +126,7 @@ class VersionRequirement:
     def constraints(self) -> tuple[Version, Version | None]:
         """Tuple of minimum (inclusive) and maximum (exclusive) versions imposed by the requirement."""
 
-        self.validate()
-
-        spec_max_constraints = [spec.max for spec in self.specs if spec.max is not None]
-        return (
-            max(spec.min for spec in self.specs),
-            min(spec_max_constraints) if len(spec_max_constraints) > 0 else None,
-        )
+        return _requirement_constraints(tuple(self.specs))
 
     def validate(self):
         """
@@ -81,15 +157,7 @@ class VersionRequirement:
             int: -1 if the version is less than the requirement, 0 if equal, 1 if greater.
         """
 
-        min_constraint, max_constraint = self.constraints
-        if version < min_constraint:
-            return -1
-
-        # The max constraint is exclusive, so we also need to check if the version is equal to it
-        if max_constraint is not None and version >= max_constraint:
-            return 1
-
-        return 0
+        return compare_constraints(version, self.constraints)
 
     def check(self, version: Version) -> bool:
         """
@@ -103,3 +171,119 @@ class VersionRequirement:
         """
 
         return self.compare(version) == 0
+
+    def _bounds(self) -> tuple[SpecBounds_T, ...]:
+        """
+        Get the precomputed bounds of each version specification.
+
+        Raises:
+            ValueError: If the version requirement includes conflicting specifications.
+        """
+
+        return _requirement_bounds(tuple(self.specs))
+
+    @staticmethod
+    def _explain(version: Version, bounds: tuple[SpecBounds_T, ...]) -> RequirementVerdict:
+        """Explain the version against the given specification bounds in a single pass."""
+
+        rejected_min: tuple[VersionSpec, Version] | None = None
+        rejected_max: tuple[VersionSpec, Version] | None = None
+        for spec, min_constraint, max_constraint in bounds:
+            # Only the tightest bound on each side is reported, which is the one `compare` uses
+            if version < min_constraint:
+                if rejected_min is None or min_constraint > rejected_min[1]:
+                    rejected_min = (spec, min_constraint)
+            elif max_constraint is not None and version >= max_constraint:
+                if rejected_max is None or max_constraint < rejected_max[1]:
+                    rejected_max = (spec, max_constraint)
+
+        # A valid requirement cannot reject a version on both sides, but the minimum takes
+        # precedence to mirror `compare`
+        if rejected_min is not None:
+            return RequirementVerdict(version, rejected_min[0], BoundSide.MIN, rejected_min[1])
+        elif rejected_max is not None:
+            return RequirementVerdict(version, rejected_max[0], BoundSide.MAX, rejected_max[1])
+
+        return RequirementVerdict(version)
+
+    def explain(self, version: Version) -> RequirementVerdict:
+        """
+        Explain whether the given version satisfies the version requirement.
+
+        Args:
+            version (Version): The version to explain.
+
+        Returns:
+            RequirementVerdict: The verdict, including the rejecting specification and bound.
+
+        Raises:
+            ValueError: If the version requirement includes conflicting specifications.
+        """
+
+        return self._explain(version, self._bounds())
+
+    def explain_many(self, versions: Iterable[Version]) -> list[RequirementVerdict]:
+        """
+        Explain whether each of the given versions satisfies the version requirement.
+
+        Args:
+            versions (Iterable[Version]): The versions to explain.
+
+        Returns:
+            list[RequirementVerdict]: The verdicts, in the same order as the given versions.
+
+        Raises:
+            ValueError: If the version requirement includes conflicting specifications.
+        """
+
+        bounds = self._bounds()
+        return [self._explain(version, bounds) for version in versions]
+
+
+@lru_cache(maxsize=4096)
+def _requirement_constraints(specs: tuple[VersionSpec, ...]) -> tuple[Version, Version | None]:
+    """
+    Validate a set of version specifications and compute the constraints they impose together.
+
+    Results are cached by the value of the specifications, so repeatedly comparing versions to
+    the same requirement does not recompute and revalidate its constraints on every call.
+
+    Args:
+        specs (tuple[VersionSpec, ...]): The version specifications of a requirement.
+
+    Returns:
+        tuple[Version, Version | None]: The minimum (inclusive) and maximum (exclusive) versions.
+
+    Raises:
+        ValueError: If the version specifications conflict.
+    """
+
+    VersionRequirement(list(specs)).validate()
+
+    spec_max_constraints = [spec.max for spec in specs if spec.max is not None]
+    return (
+        max(spec.min for spec in specs),
+        min(spec_max_constraints) if len(spec_max_constraints) > 0 else None,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _requirement_bounds(specs: tuple[VersionSpec, ...]) -> tuple[SpecBounds_T, ...]:
+    """
+    Validate a set of version specifications and compute the bounds of each one.
+
+    Results are cached by the value of the specifications, outside of the requirement itself, so
+    explaining a requirement never mutates it and equal requirements share their bounds.
+
+    Args:
+        specs (tuple[VersionSpec, ...]): The version specifications of a requirement.
+
+    Returns:
+        tuple[SpecBounds_T, ...]: Each version specification with its minimum and maximum version.
+
+    Raises:
+        ValueError: If the version specifications conflict.
+    """
+
+    VersionRequirement(list(specs)).validate()
+    return tuple((spec, spec.min, spec.max) for spec in specs)
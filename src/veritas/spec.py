@@ -1,5 +1,6 @@
 import re
 from enum import Enum
+from functools import cache
 from typing import Literal
 
 from attrs import define, field
@@ -22,6 +23,13 @@ A version specification part can be:
 """
 
 
+@cache
+def _version_specification_regex() -> re.Pattern[str]:
+    """Compile the version specification pattern on first use."""
+
+    return re.compile(VERSION_SPECIFICATION_PATTERN)
+
+
 class VersionOperation(Enum):
     """Enumeration of version operation types."""
 
@@ -147,7 +155,7 @@ class VersionSpec:
             ParseError: If the given version specification is invalid.
         """
 
-        match = re.match(VERSION_SPECIFICATION_PATTERN, specification)
+        match = _version_specification_regex().match(specification)
         if match is None:
             raise ValueError(f"Invalid version specification {specification!r}")
 
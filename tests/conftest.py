@@ -0,0 +1,25 @@
+import pytest
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter):
+    """Summarize the throughput recorded by the differential tests."""
+
+    rows = [
+        value
+        for report in terminalreporter.stats.get("passed", [])
+        for name, value in report.user_properties
+        if name == "throughput"
+    ]
+    if not rows:
+        return
+
+    # Setup such as parsing the subject is excluded on both sides, so only per-version work counts
+    terminalreporter.section("differential throughput (versions/s, setup excluded)")
+    terminalreporter.write_line(
+        f"{'engine':<32} {'versions':>8} {'reference':>12} {'engine':>12} {'speedup':>8}"
+    )
+    for engine, count, reference_ns, engine_ns in sorted(rows):
+        terminalreporter.write_line(
+            f"{engine:<32} {count:>8} {count / reference_ns * 1e9:>10.0f}/s "
+            f"{count / engine_ns * 1e9:>10.0f}/s {reference_ns / engine_ns:>7.2f}x"
+        )
@@ -0,0 +1,66 @@
+from string import printable
+
+from hypothesis import assume
+from hypothesis.strategies import (
+    SearchStrategy,
+    composite,
+    from_regex,
+    just,
+    lists,
+    one_of,
+    sampled_from,
+    tuples,
+)
+
+from veritas.constants import SEMVER_PATTERN, VERSION_SPECIFICATION_PATTERN
+from veritas.requirement import VersionRequirement
+from veritas.spec import WILD, VersionOperation
+
+# Small components and a few fixed prerelease and build identifiers make matches, bumps, and
+# ties likely, where the full patterns mostly produce huge unrelated numbers
+SMALL_SPECIFICATION_PATTERN = (
+    r"\A[0-3](\.(\*|[0-3](\.(\*|[0-3](-(\*|alpha|alpha\.1|0))?(\+(\*|build))?))?))?\Z"
+)
+SMALL_SEMVER_PATTERN = (
+    r"\A[0-3]\.[0-3]\.[0-3](-(alpha|alpha\.0|alpha\.1|0|1))?(\+(build|build\.1))?\Z"
+)
+
+specifications: SearchStrategy[str] = one_of(
+    from_regex(VERSION_SPECIFICATION_PATTERN, alphabet=printable),
+    # Operations are drawn uniformly, as the pattern rarely produces some of them
+    tuples(
+        sampled_from(["", *(op.value for op in VersionOperation)]),
+        from_regex(SMALL_SPECIFICATION_PATTERN),
+    ).map("".join),
+    just(WILD),
+)
+"""Version specification strings."""
+
+versions: SearchStrategy[str] = one_of(
+    from_regex(SEMVER_PATTERN, alphabet=printable),
+    from_regex(SMALL_SEMVER_PATTERN),
+)
+"""Fully qualified version strings."""
+
+
+def _is_valid_requirement(requirement: str) -> bool:
+    try:
+        VersionRequirement.parse(requirement)
+    except ValueError:
+        return False
+
+    return True
+
+
+@composite
+def requirements(draw, max_specs: int = 4) -> str:
+    """Version requirement strings without conflicting specifications."""
+
+    specs = draw(lists(specifications, min_size=1, max_size=max_specs))
+    # Conflicting specifications are dropped until the requirement is valid
+    while len(specs) > 1 and not _is_valid_requirement(", ".join(specs)):
+        specs.pop()
+
+    # A single specification can still be unsatisfiable on its own (e.g. `=1.2.3+build`)
+    assume(_is_valid_requirement(", ".join(specs)))
+    return ", ".join(specs)
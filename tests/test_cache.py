@@ -0,0 +1,91 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from semver import Version
+
+from veritas.cache import RequirementCache
+from veritas.requirement import VersionRequirement
+from veritas.spec import VersionSpec
+
+REQUIREMENTS = ["1", ">=1.2, <2", "^0.3", "~1.4.2", ">1.2.3-alpha", "<=2.1", "*", "=1.2.3"]
+VERSIONS = [Version.parse(v) for v in ("0.3.1", "1.0.0", "1.2.3-beta", "1.4.2", "2.1.0", "3.0.0")]
+
+
+@pytest.mark.parametrize("specification", ["1", "1.2.*", ">1.2.3-alpha+build", "<=2"])
+def test_RequirementCache_spec(specification: str):
+    cache = RequirementCache()
+    spec, min_version, max_version = cache.spec(specification)
+
+    assert spec == VersionSpec.parse(specification)
+    assert (min_version, max_version) == (spec.min, spec.max)
+    assert cache.spec(specification)[0] is spec
+
+
+@pytest.mark.parametrize("requirement", REQUIREMENTS)
+def test_RequirementCache_compare(requirement: str):
+    cache = RequirementCache()
+    req = VersionRequirement.parse(requirement)
+    for version in VERSIONS:
+        assert cache.compare(requirement, version) == req.compare(version)
+        assert cache.check(requirement, version) == req.check(version)
+
+    assert len(cache) == 1
+
+
+def test_RequirementCache_evicts_older_half_of_full_mapping():
+    cache = RequirementCache(maxsize=4)
+    published = [cache.requirement(requirement)[0] for requirement in REQUIREMENTS]
+
+    assert len(cache) == 4
+    # The newest entries survive eviction and are served without parsing them again
+    for requirement, req in zip(REQUIREMENTS[-4:], published[-4:], strict=True):
+        assert cache.requirement(requirement)[0] is req
+
+    assert cache.requirement(REQUIREMENTS[0])[0] is not published[0]
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("requirement", ["", "<1, >2"])
+def test_RequirementCache_fails_on_invalid(requirement: str):
+    cache = RequirementCache()
+    with pytest.raises(ValueError):
+        cache.requirement(requirement)
+
+    assert len(cache) == 0
+
+
+def test_RequirementCache_fails_on_invalid_size():
+    with pytest.raises(ValueError):
+        RequirementCache(maxsize=0)
+
+
+@pytest.mark.parametrize("maxsize", [2, 4096])
+def test_RequirementCache_under_contention(maxsize: int):
+    cache = RequirementCache(maxsize=maxsize)
+    threads = 8
+    barrier = threading.Barrier(threads)
+    expected = {
+        requirement: [VersionRequirement.parse(requirement).compare(v) for v in VERSIONS]
+        for requirement in REQUIREMENTS
+    }
+
+    def worker(offset: int) -> dict[str, set[int]]:
+        barrier.wait()
+        seen: dict[str, set[int]] = {requirement: set() for requirement in REQUIREMENTS}
+        for index in range(2_000):
+            requirement = REQUIREMENTS[(index + offset) % len(REQUIREMENTS)]
+            req, _, _ = cache.requirement(requirement)
+            seen[requirement].add(id(req))
+            assert [cache.compare(requirement, v) for v in VERSIONS] == expected[requirement]
+
+        return seen
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(worker, range(threads)))
+
+    if maxsize >= len(REQUIREMENTS):
+        # Without eviction, every thread must observe the single published requirement per key
+        for requirement in REQUIREMENTS:
+            assert len(set().union(*(seen[requirement] for seen in results))) == 1
@@ -0,0 +1,63 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from veritas.cli import main
+
+VERSIONS = ["1.0.0", "1.5.0", "not-a-version", "", "2.0.0", "1.9.9-rc.1", "1.2.3+build"]
+
+
+@pytest.fixture
+def versions_file(tmp_path: Path) -> Path:
+    path = tmp_path / "versions.txt"
+    path.write_text("\n".join(VERSIONS) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize(
+    "args,expected",
+    [
+        ([], ["1.5.0", "1.9.9-rc.1", "1.2.3+build"]),
+        (["--max"], ["1.9.9-rc.1"]),
+        (["--min"], ["1.2.3+build"]),
+        (["--count"], ["3"]),
+        (["--jobs", "2"], ["1.5.0", "1.9.9-rc.1", "1.2.3+build"]),
+        (["--jobs", "2", "--max"], ["1.9.9-rc.1"]),
+    ],
+)
+def test_main(
+    args: list[str], expected: list[str], versions_file: Path, capsys: pytest.CaptureFixture
+):
+    assert main([*args, ">=1.2, <2", str(versions_file)]) == 0
+    assert capsys.readouterr().out.splitlines() == expected
+
+
+def test_main_reads_stdin(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture):
+    monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(VERSIONS)))
+    assert main(["^1.5"]) == 0
+    assert capsys.readouterr().out.splitlines() == ["1.5.0"]
+
+
+def test_main_accepts_v_prefix(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture):
+    monkeypatch.setattr("sys.stdin", io.StringIO("v1.1.0\nv1.2.3\nv2.0.0\nversion\n"))
+    assert main([">=1.2, <2"]) == 0
+    assert capsys.readouterr().out.splitlines() == ["v1.2.3"]
+
+
+def test_main_without_matches(versions_file: Path, capsys: pytest.CaptureFixture):
+    assert main(["--count", ">=3", str(versions_file)]) == 1
+    assert capsys.readouterr().out.splitlines() == ["0"]
+
+
+def test_main_strict_fails_on_invalid_version(versions_file: Path, capsys: pytest.CaptureFixture):
+    assert main(["--strict", ">=1", str(versions_file)]) == 2
+    assert "not-a-version" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("args", [["<1, >2"], ["--jobs", "0", "1"], ["--max", "--min", "1"]])
+def test_main_fails_on_invalid_arguments(args: list[str]):
+    with pytest.raises(SystemExit) as exc_info:
+        main(args)
+
+    assert exc_info.value.code == 2
@@ -0,0 +1,271 @@
+"""
+Differential tests running every accelerated engine side by side with the reference implementation.
+
+Each engine is given the same generated examples as the reference code it replaces, extended with
+versions around the bounds of the generated specifications, and any
+disagreement fails the test with an example shrunk by hypothesis. Parsing the subject and other
+setup happen outside of the timed region on both sides, so the time recorded for every test only
+covers the per-version work. It is summarized at the end of the test run.
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import SearchStrategy, lists
+from semver import Version
+
+from strategies import requirements, specifications, versions
+from veritas.cache import RequirementCache
+from veritas.matcher import SpecMatcher
+from veritas.planner import plan_upgrades
+from veritas.requirement import VersionRequirement
+from veritas.spec import VersionSpec
+
+ROUNDS = 3
+"""Number of times the timed work runs per example, keeping the fastest to reduce noise."""
+
+
+class Side(NamedTuple):
+    """One side of a differential test, split into untimed setup and timed per-version work."""
+
+    prepare: Callable[[Any], Any]
+    """Builds the state for a subject (parsing, warming caches), outside of the timed region."""
+
+    run: Callable[[Any, list[Any]], list[Any]]
+    """Evaluates every candidate version against the prepared state, which is timed."""
+
+
+class Engine(NamedTuple):
+    """An accelerated engine and the reference implementation it must agree with."""
+
+    name: str
+    subjects: SearchStrategy[Any]
+    reference: Side
+    accelerated: Side
+    raw: bool = False
+    """Whether candidates are given as raw strings instead of being parsed outside of timing."""
+
+
+def _parse_specs(requirement: str) -> list[VersionSpec]:
+    return [VersionSpec.parse(specification.strip()) for specification in requirement.split(",")]
+
+
+def _cached_spec(specification: str) -> tuple[RequirementCache, str]:
+    # Each example gets its own cache, warmed with the subject, so timings only cover hits
+    cache = RequirementCache()
+    cache.spec(specification)
+    return cache, specification
+
+
+def _cached_requirement(requirement: str) -> tuple[RequirementCache, str]:
+    cache = RequirementCache()
+    cache.requirement(requirement)
+    return cache, requirement
+
+
+def _spec_lookups(specification: str, candidates: list[Version]) -> list[Any]:
+    results: list[Any] = []
+    for _ in candidates:
+        spec = VersionSpec.parse(specification)
+        results.append((spec, spec.min, spec.max))
+
+    return results
+
+
+def _cache_spec_lookups(
+    state: tuple[RequirementCache, str], candidates: list[Version]
+) -> list[Any]:
+    cache, specification = state
+    return [cache.spec(specification) for _ in candidates]
+
+
+def _specs_compare(specs: list[VersionSpec], candidates: list[Version]) -> list[Any]:
+    results: list[Any] = []
+    for version in candidates:
+        comparisons = [spec.compare(version) for spec in specs]
+        results.append(-1 if -1 in comparisons else 1 if 1 in comparisons else 0)
+
+    return results
+
+
+def _cache_compare(state: tuple[RequirementCache, str], candidates: list[Version]) -> list[Any]:
+    cache, requirement = state
+    return [cache.compare(requirement, version) for version in candidates]
+
+
+def _requirement_compare(req: VersionRequirement, candidates: list[Version]) -> list[Any]:
+    return [req.compare(version) for version in candidates]
+
+
+def _specs_check(specs: list[VersionSpec], candidates: list[str]) -> list[Any]:
+    return [any(spec.check(Version.parse(version)) for spec in specs) for version in candidates]
+
+
+def _matcher_match(matcher: SpecMatcher, candidates: list[str]) -> list[Any]:
+    return [matcher.match(version) for version in candidates]
+
+
+def _rejecting_spec(specs: list[VersionSpec], candidates: list[Version]) -> list[Any]:
+    results: list[Any] = []
+    for version in candidates:
+        # Every specification is compared on its own, keeping the first with the tightest bound
+        rejected_min: tuple[VersionSpec, Version] | None = None
+        rejected_max: tuple[VersionSpec, Version] | None = None
+        for spec in specs:
+            comparison = spec.compare(version)
+            if comparison < 0 and (rejected_min is None or spec.min > rejected_min[1]):
+                rejected_min = (spec, spec.min)
+            elif comparison > 0 and spec.max is not None:
+                if rejected_max is None or spec.max < rejected_max[1]:
+                    rejected_max = (spec, spec.max)
+
+        if rejected_min is not None:
+            results.append((-1, rejected_min[0], str(rejected_min[1])))
+        elif rejected_max is not None:
+            results.append((1, rejected_max[0], str(rejected_max[1])))
+        else:
+            results.append((0, None, None))
+
+    return results
+
+
+def _explain(req: VersionRequirement, candidates: list[Version]) -> list[Any]:
+    return [
+        (
+            verdict.comparison,
+            verdict.spec,
+            str(verdict.bound) if verdict.bound is not None else None,
+        )
+        for verdict in req.explain_many(candidates)
+    ]
+
+
+def _latest_satisfying(specs: list[VersionSpec], candidates: list[Version]) -> list[Any]:
+    satisfying = [version for version in candidates if all(spec.check(version) for spec in specs)]
+    return [max(satisfying) if satisfying else None]
+
+
+def _planner_latest_satisfying(req: VersionRequirement, candidates: list[Version]) -> list[Any]:
+    (candidate,) = plan_upgrades([("package", Version(0, 0, 0), req)], {"package": candidates})
+    return [candidate.latest_satisfying]
+
+
+def _boundary_versions(subject: str | list[str]) -> list[str]:
+    """Versions at and around the bounds of every specification in the subject."""
+
+    boundaries: list[str] = []
+    for text in [subject] if isinstance(subject, str) else subject:
+        for specification in text.split(","):
+            spec = VersionSpec.parse(specification.strip())
+            for bound in (spec.min, spec.max):
+                if bound is None:
+                    continue
+
+                boundaries.extend(
+                    str(version)
+                    for version in (
+                        bound,
+                        bound.replace(prerelease=None, build=None),
+                        bound.bump_prerelease(),
+                        bound.bump_patch(),
+                        bound.bump_minor(),
+                    )
+                )
+
+    return boundaries
+
+
+SPECS = Side(_parse_specs, _specs_compare)
+"""Reference comparing every specification of a requirement on its own."""
+
+ENGINES = [
+    # Every candidate stands for one lookup of the subject, as a specification has no versions
+    Engine(
+        "RequirementCache.spec",
+        specifications,
+        Side(str, _spec_lookups),
+        Side(_cached_spec, _cache_spec_lookups),
+    ),
+    Engine(
+        "RequirementCache.compare",
+        requirements(),
+        SPECS,
+        Side(_cached_requirement, _cache_compare),
+    ),
+    Engine(
+        "VersionRequirement.compare",
+        requirements(),
+        SPECS,
+        Side(VersionRequirement.parse, _requirement_compare),
+    ),
+    # Single specifications are checked on their own too, as a union easily hides a wrong match
+    Engine(
+        "SpecMatcher.match (single)",
+        specifications.map(lambda s: [s]),
+        Side(lambda specs: _parse_specs(",".join(specs)), _specs_check),
+        Side(SpecMatcher.parse, _matcher_match),
+        raw=True,
+    ),
+    Engine(
+        "SpecMatcher.match",
+        lists(specifications, min_size=1, max_size=4),
+        Side(lambda specs: _parse_specs(",".join(specs)), _specs_check),
+        Side(SpecMatcher.parse, _matcher_match),
+        raw=True,
+    ),
+    Engine(
+        "VersionRequirement.explain",
+        requirements(),
+        Side(_parse_specs, _rejecting_spec),
+        Side(VersionRequirement.parse, _explain),
+    ),
+    Engine(
+        "plan_upgrades",
+        requirements(),
+        Side(_parse_specs, _latest_satisfying),
+        Side(VersionRequirement.parse, _planner_latest_satisfying),
+    ),
+]
+"""Accelerated engines gated against the reference implementation."""
+
+
+def _timed(side: Side, subject: Any, candidates: list[Any]) -> tuple[list[Any], int]:
+    """Run the per-version work of the side, returning its results and fastest time."""
+
+    state = side.prepare(subject)
+    fastest: int | None = None
+    for _ in range(ROUNDS):
+        start = time.perf_counter_ns()
+        results = side.run(state, candidates)
+        elapsed = time.perf_counter_ns() - start
+        fastest = elapsed if fastest is None else min(fastest, elapsed)
+
+    assert fastest is not None
+    return results, fastest
+
+
+@pytest.mark.parametrize("engine", ENGINES, ids=[engine.name for engine in ENGINES])
+def test_engine_agrees_with_reference(engine: Engine, record_property: Callable[[str, Any], None]):
+    timings = {"versions": 0, "reference_ns": 0, "engine_ns": 0}
+
+    @given(engine.subjects, lists(versions, min_size=1, max_size=10))
+    def run(subject: Any, candidates: list[str]):
+        # Versions around the bounds are where engines are most likely to disagree
+        candidates = [*candidates, *_boundary_versions(subject)]
+        parsed: list[Any] = candidates
+        if not engine.raw:
+            parsed = [Version.parse(version) for version in candidates]
+
+        expected, reference_ns = _timed(engine.reference, subject, parsed)
+        actual, engine_ns = _timed(engine.accelerated, subject, parsed)
+
+        assert actual == expected
+        timings["versions"] += len(parsed)
+        timings["reference_ns"] += reference_ns
+        timings["engine_ns"] += engine_ns
+
+    run()
+    record_property("throughput", (engine.name, *timings.values()))
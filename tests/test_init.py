@@ -0,0 +1,38 @@
+import subprocess
+import sys
+
+import pytest
+
+import veritas
+
+
+def _run_python(code: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_is_lazy():
+    result = _run_python(
+        "import sys, veritas; "
+        "print(','.join(sorted(m for m in ('attrs', 'semver', 're', 'veritas.spec') "
+        "if m in sys.modules)))"
+    )
+    # `re` may already be loaded by the interpreter itself (e.g. through `site`), so only the
+    # modules the package would have pulled in on its own are checked
+    loaded = set(result.stdout.strip().split(",")) - {"", "re"}
+    assert loaded == set()
+
+
+@pytest.mark.parametrize("name", veritas.__all__)
+def test_lazy_attribute_resolves(name: str):
+    assert getattr(veritas, name).__name__ == name
+    assert name in dir(veritas)
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        veritas.DoesNotExist  # noqa: B018
@@ -0,0 +1,55 @@
+import pytest
+from hypothesis import given
+from hypothesis.strategies import lists
+from semver import Version
+
+from strategies import specifications, versions
+from veritas.matcher import SpecMatcher
+from veritas.spec import VersionSpec
+
+
+@pytest.mark.parametrize(
+    "specifications,version,expected",
+    [
+        (["*"], "0.0.0", True),
+        (["*"], "1.2.3-alpha", True),
+        (["1.*"], "1.9.9", True),
+        (["1.*"], "2.0.0", False),
+        (["1.2.*"], "1.2.0", True),
+        (["1.2.*"], "1.2.0-alpha", False),
+        (["1.2.*"], "1.3.0-alpha", True),
+        (["1.2.*"], "1.3.0", False),
+        (["^1.2"], "1.2.7", True),
+        (["~1.2.3"], "1.2.3+build", True),
+        (["=1.2"], "1.2.0", True),
+        (["=1.2"], "1.2.1", False),
+        (["=1.*"], "1.0.0", True),
+        (["=1.*"], "1.1.0", False),
+        (["1.2.3"], "1.2.3", True),
+        (["1.2.3"], "1.2.30", False),
+        (["1.2.3-alpha"], "1.2.3-alpha", True),
+        (["1.2.3-alpha"], "1.2.3", False),
+        (["1.2.*", ">5"], "6.0.0", True),
+        (["1.2.*", ">5"], "5.9.9", False),
+        (["1.2.*", "<=0.3"], "0.3.9", True),
+    ],
+)
+def test_SpecMatcher_match(specifications: list[str], version: str, expected: bool):
+    matcher = SpecMatcher.parse(specifications)
+    assert matcher.match(version) == expected
+    assert matcher.match(version.encode("ascii")) == expected
+    assert matcher.match(memoryview(version.encode("ascii"))) == expected
+    assert matcher.check(Version.parse(version)) == expected
+
+
+@pytest.mark.parametrize("version", ["", "1.2", "01.2.3", "1.2.3.4", "1.2.x", "١.2.3", b"\xff.1.2"])
+def test_SpecMatcher_match_fails_on_invalid(version: str | bytes):
+    with pytest.raises(ValueError):
+        SpecMatcher.parse(["*"]).match(version)
+
+
+@given(lists(specifications, min_size=1, max_size=4), versions)
+def test_SpecMatcher_match_agrees_with_check(specifications: list[str], version: str):
+    specs = [VersionSpec.parse(specification) for specification in specifications]
+    expected = any(spec.check(Version.parse(version)) for spec in specs)
+    assert SpecMatcher(specs).match(version) == expected
@@ -0,0 +1,76 @@
+import pytest
+from semver import Version
+
+from veritas.planner import plan_upgrades
+from veritas.requirement import VersionRequirement
+
+CATALOG = {
+    "alpha": [Version.parse(v) for v in ("2.0.0", "1.0.0", "1.4.2", "1.5.0-rc.1", "1.9.0")],
+    "beta": [Version.parse(v) for v in ("0.1.0", "0.2.0", "0.2.5")],
+    "empty": [],
+}
+
+
+@pytest.mark.parametrize(
+    "package,pinned,requirement,latest_satisfying,latest",
+    [
+        ("alpha", "1.0.0", "^1", "1.9.0", "2.0.0"),
+        ("alpha", "1.0.0", ">=1.4, <1.4.3", "1.4.2", "2.0.0"),
+        ("alpha", "1.0.0", ">=1.4.3, <1.5", "1.5.0-rc.1", "2.0.0"),
+        ("alpha", "1.0.0", ">2", None, "2.0.0"),
+        ("alpha", "2.0.0", ">=1", "2.0.0", "2.0.0"),
+        ("alpha", "1.0.0", "<1", None, "2.0.0"),
+        ("beta", "0.1.0", "0.2", "0.2.5", "0.2.5"),
+        ("empty", "1.0.0", "*", None, None),
+        ("missing", "1.0.0", "*", None, None),
+    ],
+)
+def test_plan_upgrades(
+    package: str,
+    pinned: str,
+    requirement: str,
+    latest_satisfying: str | None,
+    latest: str | None,
+):
+    req = VersionRequirement.parse(requirement)
+    (candidate,) = plan_upgrades([(package, Version.parse(pinned), req)], CATALOG)
+
+    assert candidate.package == package
+    assert candidate.requirement == req
+    if latest_satisfying is None:
+        assert candidate.latest_satisfying is None
+    else:
+        assert candidate.latest_satisfying is not None
+        assert candidate.latest_satisfying == Version.parse(latest_satisfying)
+
+    if latest is None:
+        assert candidate.latest is None
+    else:
+        assert candidate.latest is not None
+        assert candidate.latest == Version.parse(latest)
+
+
+def test_plan_upgrades_matches_check():
+    requirements = ["*", "1", "^1.4", ">=1.4, <2", "<1.5", "=1.4.2", ">1.9"]
+    rows = [
+        ("alpha", Version.parse("1.0.0"), VersionRequirement.parse(requirement))
+        for requirement in requirements * 3
+    ]
+
+    for candidate in plan_upgrades(rows, CATALOG):
+        satisfying = [
+            version for version in CATALOG["alpha"] if candidate.requirement.check(version)
+        ]
+        assert candidate.latest_satisfying == (max(satisfying) if satisfying else None)
+
+
+def test_plan_upgrades_preserves_row_order():
+    rows = [
+        ("beta", Version.parse("0.2.5"), VersionRequirement.parse("0.2")),
+        ("alpha", Version.parse("1.4.2"), VersionRequirement.parse("^1")),
+        ("beta", Version.parse("0.1.0"), VersionRequirement.parse("0.2")),
+    ]
+    candidates = plan_upgrades(rows, CATALOG)
+
+    assert [(c.package, c.pinned) for c in candidates] == [(p, v) for p, v, _ in rows]
+    assert [c.upgradable for c in candidates] == [False, True, True]
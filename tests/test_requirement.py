@@ -1,7 +1,9 @@
 import pytest
+from attrs import asdict
 from semver import Version
 
-from veritas.requirement import VersionRequirement
+from veritas.requirement import BoundSide, VersionRequirement, compare_constraints
+from veritas.spec import VersionSpec
 
 
 @pytest.mark.parametrize(
@@ -79,3 +81,94 @@ def test_VersionRequirement_compare(requirement: str, version: str, expected: in
 )
 def test_VersionRequirement_check(requirement: str, version: str):
     assert VersionRequirement.parse(requirement).check(Version.parse(version))
+
+
+@pytest.mark.parametrize(
+    "min_version,max_version,version,expected",
+    [
+        ("1.0.0", "2.0.0", "0.9.0", -1),
+        ("1.0.0", "2.0.0", "1.0.0", 0),
+        ("1.0.0", "2.0.0", "2.0.0", 1),
+        ("1.0.0", None, "9.0.0", 0),
+    ],
+)
+def test_compare_constraints(
+    min_version: str, max_version: str | None, version: str, expected: int
+):
+    constraints = (
+        Version.parse(min_version),
+        Version.parse(max_version) if max_version is not None else None,
+    )
+    assert compare_constraints(Version.parse(version), constraints) == expected
+
+
+def test_VersionRequirement_compare_follows_spec_changes():
+    req = VersionRequirement.parse(">=1")
+    assert req.compare(Version.parse("1.5.0")) == 0
+
+    req.specs.append(VersionSpec.parse("<1.5"))
+    assert req.compare(Version.parse("1.5.0")) == 1
+
+
+def test_VersionRequirement_compare_fails_on_invalid():
+    req = VersionRequirement([VersionSpec.parse("<1"), VersionSpec.parse(">2")])
+    with pytest.raises(ValueError):
+        req.compare(Version.parse("1.0.0"))
+
+
+@pytest.mark.parametrize(
+    "requirement,version,spec,side,bound",
+    [
+        ("1", "1.5.0", None, None, None),
+        ("1", "0.1.0", "1", BoundSide.MIN, "1.0.0"),
+        ("1", "2.0.0", "1", BoundSide.MAX, "2.0.0"),
+        (">=1, >=1.2, <3, <2", "1.1.0", ">=1.2", BoundSide.MIN, "1.2.0"),
+        (">=1, >=1.2, <3, <2", "0.1.0", ">=1.2", BoundSide.MIN, "1.2.0"),
+        (">=1, >=1.2, <3, <2", "2.5.0", "<2", BoundSide.MAX, "2.0.0"),
+        (">1.2.3-alpha", "1.2.3-alpha", ">1.2.3-alpha", BoundSide.MIN, "1.2.3-alpha.1"),
+    ],
+)
+def test_VersionRequirement_explain(
+    requirement: str, version: str, spec: str | None, side: BoundSide | None, bound: str | None
+):
+    req = VersionRequirement.parse(requirement)
+    verdict = req.explain(Version.parse(version))
+
+    assert verdict.version == Version.parse(version)
+    assert (str(verdict.spec) if verdict.spec is not None else None) == spec
+    assert verdict.side == side
+    if bound is None:
+        assert verdict.bound is None
+    else:
+        assert verdict.bound is not None
+        assert verdict.bound == Version.parse(bound)
+    assert verdict.satisfied == req.check(Version.parse(version))
+    assert verdict.comparison == req.compare(Version.parse(version))
+
+
+def test_VersionRequirement_explain_many():
+    req = VersionRequirement.parse(">=1.2, <2")
+    versions = [Version.parse(v) for v in ("1.0.0", "1.5.0", "2.0.0")]
+
+    assert [verdict.comparison for verdict in req.explain_many(versions)] == [-1, 0, 1]
+
+
+def test_VersionRequirement_explain_follows_spec_changes():
+    req = VersionRequirement.parse(">=1")
+    assert req.explain(Version.parse("1.5.0")).satisfied
+
+    req.specs.append(VersionSpec.parse("<1.5"))
+    assert req.explain(Version.parse("1.5.0")).side == BoundSide.MAX
+
+
+def test_VersionRequirement_explain_does_not_mutate():
+    req = VersionRequirement.parse(">=1, <2")
+    req.explain(Version.parse("1.5.0"))
+
+    assert list(asdict(req)) == ["specs"]
+
+
+def test_VersionRequirement_explain_fails_on_invalid():
+    req = VersionRequirement([VersionSpec.parse("<1"), VersionSpec.parse(">2")])
+    with pytest.raises(ValueError):
+        req.explain(Version.parse("1.0.0"))